@@ -34,11 +34,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib.util
 import json
+import logging
 import subprocess
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 # =============================================================================
@@ -803,12 +807,9 @@ def get_npm_languages(languages: list[str]) -> list[str]:
     return [ls_id for ls_id in languages if LANGUAGE_SERVERS.get(ls_id, {}).get("type") == "npm"]
 
 
-def build_bundle_command(config: BuildConfig, binary_languages: list[str]) -> list[str]:
-    """Build the bundle_language_servers.py command for binary servers only."""
-    script_path = Path(__file__).parent / "bundle_language_servers.py"
-
-    cmd = [sys.executable, str(script_path)]
-    cmd.extend(["--output-dir", config.output_dir])
+def build_bundle_args(config: BuildConfig, binary_languages: list[str]) -> list[str]:
+    """Build the bundle_language_servers.py arguments for binary servers only."""
+    cmd = ["--output-dir", config.output_dir]
 
     if config.platform:
         cmd.extend(["--platform", config.platform])
@@ -826,8 +827,61 @@ def build_bundle_command(config: BuildConfig, binary_languages: list[str]) -> li
     return cmd
 
 
-def run_build(config: BuildConfig) -> int:
-    """Execute the build process."""
+def build_bundle_command(config: BuildConfig, binary_languages: list[str]) -> list[str]:
+    """Build the bundle_language_servers.py command for binary servers only."""
+    script_path = Path(__file__).parent / "bundle_language_servers.py"
+    return [sys.executable, str(script_path), *build_bundle_args(config, binary_languages)]
+
+
+@functools.cache
+def load_bundler() -> ModuleType:
+    """Load bundle_language_servers.py as a module; it is executed only once per process."""
+    script_path = Path(__file__).parent / "bundle_language_servers.py"
+    spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+    assert spec is not None and spec.loader is not None
+    bundler = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = bundler  # required for the bundler's dataclasses
+    try:
+        spec.loader.exec_module(bundler)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    return bundler
+
+
+def run_bundler_in_process(bundle_args: list[str]) -> int:
+    """
+    Run bundle_language_servers.py in this interpreter, avoiding a second Python startup.
+
+    Failures are turned into a non-zero return code, as they would be for a separate bundler process,
+    and the logging configuration the bundler sets up is removed again afterwards.
+    """
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+    try:
+        return load_bundler().main(bundle_args)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception as e:
+        print(f"\n  [ERROR] {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        for handler in root_logger.handlers:
+            if handler not in saved_handlers:
+                handler.close()
+        root_logger.handlers[:] = saved_handlers
+        root_logger.setLevel(saved_level)
+
+
+def run_build(config: BuildConfig, isolate: bool = False) -> int:
+    """
+    Execute the build process.
+
+    Args:
+        config: The resolved build configuration.
+        isolate: Run the language server bundler in a separate Python process instead of in-process.
+
+    """
     print_header("Building Serena Standalone")
 
     # Separate binary and npm languages
@@ -839,14 +893,20 @@ def run_build(config: BuildConfig) -> int:
         print_section("Bundling Binary Language Servers")
         print(f"  Languages: {', '.join(binary_langs)}")
 
-        bundle_cmd = build_bundle_command(config, binary_langs)
-        print(f"  Executing: {' '.join(bundle_cmd)}")
-        print()
+        if isolate:
+            bundle_cmd = build_bundle_command(config, binary_langs)
+            print(f"  Executing: {' '.join(bundle_cmd)}")
+            print()
+            returncode = subprocess.run(bundle_cmd, check=False).returncode
+        else:
+            bundle_args = build_bundle_args(config, binary_langs)
+            print(f"  Executing: bundle_language_servers.py {' '.join(bundle_args)}")
+            print()
+            returncode = run_bundler_in_process(bundle_args)
 
-        result = subprocess.run(bundle_cmd, check=False)
-        if result.returncode != 0:
+        if returncode != 0:
             print("\n  [ERROR] Bundling failed!")
-            return result.returncode
+            return returncode
     else:
         print_section("No Binary Language Servers Selected")
         print("  Skipping binary bundling step.")
@@ -899,7 +959,7 @@ def run_build(config: BuildConfig) -> int:
 # =============================================================================
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Serena Custom Build Generator - Precise Language Selection",
@@ -971,6 +1031,11 @@ Examples:
         action="store_true",
         help="Skip PyInstaller (bundle language servers only)",
     )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run the language server bundler in a separate Python process",
+    )
     parser.add_argument(
         "--list-languages",
         action="store_true",
@@ -988,7 +1053,7 @@ Examples:
         help="Force interactive mode even with other arguments",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle list commands
     if args.list_languages:
@@ -1006,13 +1071,12 @@ Examples:
 
     if args.config:
         # Load from file
-        config_path = Path(args.config)
-        if not config_path.exists():
+        try:
+            with open(args.config) as f:
+                config = BuildConfig.from_dict(json.load(f))
+        except FileNotFoundError:
             print(f"Error: Config file not found: {args.config}")
             return 1
-
-        with open(config_path) as f:
-            config = BuildConfig.from_dict(json.load(f))
         print(f"Loaded configuration from: {args.config}")
 
     elif args.languages or args.preset:
@@ -1086,7 +1150,7 @@ Examples:
         print()
 
     # Run build
-    return run_build(config)
+    return run_build(config, isolate=args.isolate)
 
 
 if __name__ == "__main__":
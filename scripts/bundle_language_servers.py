@@ -30,6 +30,7 @@ Options:
     --include-java        Include Eclipse JDTLS, Gradle, and Kotlin LS (adds ~285MB)
     --include-go          Include Gopls (requires Go toolchain, adds ~30MB)
     --dry-run            Show what would be downloaded without downloading
+    --jobs N              Number of language servers to download concurrently (default: 4)
     --verbose            Enable verbose output
     --ls ID [ID ...]      Only bundle specific language servers by ID
 """
@@ -42,15 +43,15 @@ import os
 import platform
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-# Add src to path for imports
+# Add src to path for imports (solidlsp is imported lazily: only for platform detection and downloads, not for --help)
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from solidlsp.ls_utils import FileUtils, PlatformUtils
-
 log = logging.getLogger(__name__)
 
 
@@ -416,6 +417,9 @@ LANGUAGE_SERVERS: list[LanguageServerBundle] = [
 
 def get_current_platform() -> str:
     """Get the current platform identifier."""
+    # Imported outside the try block: a broken solidlsp installation must fail loudly instead of falling back
+    from solidlsp.ls_utils import PlatformUtils
+
     try:
         return PlatformUtils.get_platform_id().value
     except Exception:
@@ -442,6 +446,26 @@ def get_current_platform() -> str:
         raise ValueError(f"Unsupported platform: {system}-{machine}")
 
 
+def get_binary_path(ls_bundle: LanguageServerBundle, platform_id: str, output_dir: Path) -> Path:
+    """Get the path of the main binary of a bundled language server."""
+    config = ls_bundle.platforms[platform_id]
+    return output_dir / config["target_dir"] / config["binary_path"]
+
+
+def run_with_stderr_tail(cmd: list[str], env: dict[str, str] | None = None, max_lines: int = 200) -> tuple[int, str]:
+    """Run a command, discarding stdout and keeping only the last max_lines lines of stderr.
+
+    Returns a tuple of (returncode, stderr_tail).
+    """
+    stderr_tail: deque[str] = deque(maxlen=max_lines)
+    with subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True) as process:
+        assert process.stderr is not None
+        for line in process.stderr:
+            stderr_tail.append(line)
+        returncode = process.wait()
+    return returncode, "".join(stderr_tail)
+
+
 def download_language_server(
     ls_bundle: LanguageServerBundle,
     platform_id: str,
@@ -452,28 +476,31 @@ def download_language_server(
 
     Returns True if successful, False otherwise.
     """
+    # Downloads run concurrently, so every line is tagged with the language server it belongs to
+    prefix = f"[{ls_bundle.id}]"
+
     if platform_id not in ls_bundle.platforms:
-        log.warning(f"  {ls_bundle.name}: No binary available for platform {platform_id}")
+        log.warning(f"{prefix} {ls_bundle.name}: No binary available for platform {platform_id}")
         return False
 
     config = ls_bundle.platforms[platform_id]
     url = config["url"]
     archive_type = config["archive_type"]
     target_dir = output_dir / config["target_dir"]
-    binary_path = target_dir / config["binary_path"]
+    binary_path = get_binary_path(ls_bundle, platform_id, output_dir)
 
-    log.info(f"  {ls_bundle.name}:")
-    log.info(f"    URL: {url}")
-    log.info(f"    Target: {target_dir}")
-    log.info(f"    Estimated size: ~{ls_bundle.estimated_size_mb} MB")
+    log.info(f"{prefix} {ls_bundle.name}:")
+    log.info(f"{prefix} URL: {url}")
+    log.info(f"{prefix} Target: {target_dir}")
+    log.info(f"{prefix} Estimated size: ~{ls_bundle.estimated_size_mb} MB")
 
     if dry_run:
-        log.info("    [DRY RUN] Would download and extract")
+        log.info(f"{prefix} [DRY RUN] Would download and extract")
         return True
 
     # Check if already downloaded
     if binary_path.exists():
-        log.info(f"    Already exists at {binary_path}")
+        log.info(f"{prefix} Already exists at {binary_path}")
         return True
 
     try:
@@ -483,12 +510,12 @@ def download_language_server(
         # Special handling for go-install (build from source)
         if archive_type == "go-install":
             if not url.startswith("build-from-source:"):
-                log.error("    Invalid URL format for go-install. Expected 'build-from-source:' prefix")
+                log.error(f"{prefix} Invalid URL format for go-install. Expected 'build-from-source:' prefix")
                 return False
 
             # Extract package path from URL (e.g., "golang.org/x/tools/gopls@v0.20.0")
             package = url.split("build-from-source:", 1)[1]
-            log.info(f"    Building from source: {package}")
+            log.info(f"{prefix} Building from source: {package}")
 
             # Check if Go is installed
             try:
@@ -500,14 +527,14 @@ def download_language_server(
                 )
                 if go_version_result.returncode != 0:
                     raise FileNotFoundError("Go not found")
-                log.info(f"    Using {go_version_result.stdout.strip()}")
+                log.info(f"{prefix} Using {go_version_result.stdout.strip()}")
             except FileNotFoundError:
-                log.error("    Go toolchain not found. Please install Go from https://golang.org/")
-                log.error("    Gopls must be built from source as no pre-built binaries are available.")
+                log.error(f"{prefix} Go toolchain not found. Please install Go from https://golang.org/")
+                log.error(f"{prefix} Gopls must be built from source as no pre-built binaries are available.")
                 return False
 
             # Build the binary for the target platform
-            log.info(f"    Building gopls for {platform_id}...")
+            log.info(f"{prefix} Building gopls for {platform_id}...")
 
             # Determine GOOS and GOARCH from platform_id
             platform_map = {
@@ -520,7 +547,7 @@ def download_language_server(
             }
 
             if platform_id not in platform_map:
-                log.error(f"    Unsupported platform for go-install: {platform_id}")
+                log.error(f"{prefix} Unsupported platform for go-install: {platform_id}")
                 return False
 
             goos, goarch = platform_map[platform_id]
@@ -531,23 +558,19 @@ def download_language_server(
             env["GOARCH"] = goarch
             env["CGO_ENABLED"] = "0"  # Disable CGO for static binary
 
-            build_result = subprocess.run(
-                ["go", "build", "-o", str(binary_path), package],
-                env=env,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            build_returncode, build_stderr = run_with_stderr_tail(["go", "build", "-o", str(binary_path), package], env=env)
 
-            if build_result.returncode != 0:
-                log.error(f"    Build failed: {build_result.stderr}")
+            if build_returncode != 0:
+                log.error(f"{prefix} Build failed: {build_stderr}")
                 return False
 
-            log.info("    Build completed successfully")
+            log.info(f"{prefix} Build completed successfully")
 
         else:
             # Download and extract (existing logic)
-            log.info("    Downloading...")
+            from solidlsp.ls_utils import FileUtils
+
+            log.info(f"{prefix} Downloading...")
 
             # For .gz files (single binary compressed), extract directly to binary path
             # For other archives, extract to target directory
@@ -558,19 +581,19 @@ def download_language_server(
 
         # Verify binary exists
         if not binary_path.exists():
-            log.error(f"    Binary not found after extraction: {binary_path}")
+            log.error(f"{prefix} Binary not found after extraction: {binary_path}")
             return False
 
         # Make binary executable on Unix
         if not platform_id.startswith("win"):
             os.chmod(binary_path, 0o755)
-            log.info(f"    Set executable permissions on {binary_path}")
+            log.info(f"{prefix} Set executable permissions on {binary_path}")
 
-        log.info(f"    Successfully downloaded to {target_dir}")
+        log.info(f"{prefix} Successfully downloaded to {target_dir}")
         return True
 
     except Exception as e:
-        log.error(f"    Failed to download: {e}")
+        log.error(f"{prefix} Failed to download: {e}")
         return False
 
 
@@ -589,7 +612,7 @@ def create_manifest(output_dir: Path, platform_id: str, downloaded: list[str]) -
     log.info(f"Created manifest at {manifest_path}")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Download and bundle binary language servers for offline builds.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -622,6 +645,13 @@ def main() -> int:
         action="store_true",
         help="Show what would be downloaded without downloading",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=4,
+        help="Number of language servers to download concurrently (default: 4)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -635,7 +665,7 @@ def main() -> int:
         help="Specific language servers to bundle (e.g., --ls clangd terraform-ls)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Setup logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
@@ -686,17 +716,19 @@ def main() -> int:
     log.info(f"\nLanguage servers to bundle ({len(servers_to_bundle)}):")
     log.info(f"Estimated total size: ~{total_size_mb} MB\n")
 
-    # Download each language server
-    downloaded: list[str] = []
-    failed: list[str] = []
+    # Downloads are independent and I/O-bound, so they can overlap (a dry run is instant, keep its output ordered)
+    max_workers = 1 if args.dry_run else max(1, args.jobs)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda ls_bundle: download_language_server(ls_bundle, platform_id, output_dir, args.dry_run),
+                servers_to_bundle,
+            )
+        )
 
-    for ls_bundle in servers_to_bundle:
-        success = download_language_server(ls_bundle, platform_id, output_dir, args.dry_run)
-        if success:
-            downloaded.append(ls_bundle.id)
-        else:
-            if not ls_bundle.optional:
-                failed.append(ls_bundle.id)
+    outcomes = list(zip(servers_to_bundle, results, strict=True))
+    downloaded = [ls_bundle.id for ls_bundle, success in outcomes if success]
+    failed = [ls_bundle.id for ls_bundle, success in outcomes if not success and not ls_bundle.optional]
 
     # Create manifest
     if not args.dry_run and downloaded:
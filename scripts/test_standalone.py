@@ -20,10 +20,32 @@ import os
 import subprocess
 import sys
 import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 
+@dataclass(slots=True)
+class TestResult:
+    """Outcome of a single standalone test."""
+
+    __test__ = False  # not a pytest test class
+
+    name: str
+    status: str
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        result = {"name": self.name, "status": self.status}
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
+
 class StandaloneTestRunner:
     """Test runner for standalone executable builds."""
 
@@ -31,7 +53,9 @@ class StandaloneTestRunner:
         self.executable = Path(executable_path).resolve()
         self.tests_passed = 0
         self.tests_failed = 0
-        self.test_results: list[dict[str, Any]] = []
+        self.test_results: list[TestResult] = []
+        self._help_result: subprocess.CompletedProcess | None = None
+        self._help_lock = threading.Lock()
 
         if not self.executable.exists():
             raise FileNotFoundError(f"Executable not found: {self.executable}")
@@ -56,42 +80,84 @@ class StandaloneTestRunner:
         except subprocess.TimeoutExpired:
             raise RuntimeError(f"Command timed out after {timeout}s: {' '.join(cmd)}")
 
-    def test(self, name: str, fn, retries: int = 1):
-        """Run a test and record results. Retry on timeout errors."""
-        print(f"\n{'='*60}")
-        print(f"TEST: {name}")
-        print("=" * 60)
-
-        for attempt in range(retries + 1):
+    def run_help(self, timeout: int = 90) -> subprocess.CompletedProcess:
+        """
+        Run the executable with --help once and return the cached result on subsequent calls.
+
+        Most tests only inspect the plain help output, so they share a single run instead of
+        each paying the start-up cost of the executable. Concurrent callers wait for the first run.
+        """
+        with self._help_lock:
+            if self._help_result is None:
+                self._help_result = self.run_command(["--help"], timeout=timeout)
+            return self._help_result
+
+    def record(self, name: str, status: str, error: str | None = None) -> None:
+        """Record a test outcome and update the pass/fail counters."""
+        self.test_results.append(TestResult(name, status, error))
+        if status == "PASSED":
+            self.tests_passed += 1
+        else:
+            self.tests_failed += 1
+
+    def execute(self, name: str, fn, retries: int = 1) -> tuple[str, str | None, list[str]]:
+        """
+        Run a test function, retrying on timeout errors.
+
+        Returns:
+            (status, error, retry_messages)
+
+        """
+        retry_messages: list[str] = []
+        attempt = 0
+        while True:
             try:
                 fn()
-                self.tests_passed += 1
-                self.test_results.append({"name": name, "status": "PASSED"})
-                print(f"[PASS] {name}")
-                return
+                return "PASSED", None, retry_messages
             except AssertionError as e:
-                self.tests_failed += 1
-                self.test_results.append({"name": name, "status": "FAILED", "error": str(e)})
-                print(f"[FAIL] {name}")
-                print(f"  Error: {e}")
-                return
+                return "FAILED", str(e), retry_messages
             except RuntimeError as e:
                 # Timeout errors - retry
-                if attempt < retries:
-                    print(f"[RETRY] {name} (attempt {attempt + 1}/{retries + 1})")
-                    print("  Timeout, retrying...")
-                    continue
-                self.tests_failed += 1
-                self.test_results.append({"name": name, "status": "ERROR", "error": str(e)})
-                print(f"[ERROR] {name}")
-                print(f"  Exception: {e}")
-                return
+                if attempt >= retries:
+                    return "ERROR", str(e), retry_messages
+                retry_messages.append(f"[RETRY] {name} (attempt {attempt + 1}/{retries + 1})")
+                retry_messages.append("  Timeout, retrying...")
+                attempt += 1
             except Exception as e:
-                self.tests_failed += 1
-                self.test_results.append({"name": name, "status": "ERROR", "error": str(e)})
-                print(f"[ERROR] {name}")
-                print(f"  Exception: {e}")
-                return
+                return "ERROR", str(e), retry_messages
+
+    def report(self, name: str, status: str, error: str | None, retry_messages: list[str]) -> None:
+        """Print and record the outcome of a test, writing its output as a single block."""
+        lines = [f"\n{'='*60}", f"TEST: {name}", "=" * 60, *retry_messages]
+
+        self.record(name, status, error)
+        if status == "PASSED":
+            lines.append(f"[PASS] {name}")
+        elif status == "FAILED":
+            lines.append(f"[FAIL] {name}")
+            lines.append(f"  Error: {error}")
+        else:
+            lines.append(f"[ERROR] {name}")
+            lines.append(f"  Exception: {error}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def test(self, name: str, fn, retries: int = 1):
+        """Run a test and record results. Retry on timeout errors."""
+        self.report(name, *self.execute(name, fn, retries))
+
+    def test_concurrently(self, tests: list[tuple[str, Callable[[], None]]], jobs: int) -> None:
+        """
+        Run independent tests on a thread pool and record results in the given order.
+
+        The tests mostly wait for the executable to finish, so running them concurrently
+        reduces the wall time to roughly that of the slowest tests.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            futures = [executor.submit(self.execute, name, fn) for name, fn in tests]
+            for (name, _), future in zip(tests, futures, strict=True):
+                self.report(name, *future.result())
 
     def assert_in_output(self, result: subprocess.CompletedProcess, expected: str, location: str = "stdout"):
         """Assert that expected string is in command output."""
@@ -110,7 +176,7 @@ class StandaloneTestRunner:
 
     def test_help_command(self):
         """Test --help shows usage information."""
-        result = self.run_command(["--help"])
+        result = self.run_help()
         self.assert_exit_code(result, 0)
         self.assert_in_output(result, "Serena MCP server")
         self.assert_in_output(result, "--project")
@@ -121,7 +187,7 @@ class StandaloneTestRunner:
         """Test executable starts without critical errors."""
         # Use longer timeout for first run - PyInstaller needs to extract files on first execution
         # Windows especially needs more time due to antivirus scanning and slower disk I/O
-        result = self.run_command(["--help"], timeout=120)
+        result = self.run_help(timeout=120)
         self.assert_exit_code(result, 0)
         # Should not have Python import errors or missing module errors
         assert "ModuleNotFoundError" not in result.stderr, f"Import error in stderr: {result.stderr}"
@@ -130,7 +196,7 @@ class StandaloneTestRunner:
     def test_version_info(self):
         """Test that version information is available."""
         # The CLI might not have --version, so we check --help runs successfully
-        result = self.run_command(["--help"])
+        result = self.run_help()
         self.assert_exit_code(result, 0)
 
     # =========================================================================
@@ -139,14 +205,14 @@ class StandaloneTestRunner:
 
     def test_frozen_mode_detection(self):
         """Test that frozen mode is detected correctly."""
-        result = self.run_command(["--help"])
+        result = self.run_help()
         self.assert_exit_code(result, 0)
         # No errors about sys._MEIPASS or frozen attribute
         assert "_MEIPASS" not in result.stderr, "PyInstaller path handling error"
 
     def test_no_python_path_errors(self):
         """Test no Python path or import errors occur."""
-        result = self.run_command(["--help"])
+        result = self.run_help()
         self.assert_exit_code(result, 0)
         # Check for common PyInstaller issues
         error_indicators = [
@@ -184,7 +250,7 @@ class StandaloneTestRunner:
 
     def test_cli_options_present(self):
         """Test that all expected CLI options are present."""
-        result = self.run_command(["--help"])
+        result = self.run_help()
         self.assert_exit_code(result, 0)
 
         expected_options = [
@@ -202,7 +268,7 @@ class StandaloneTestRunner:
 
     def test_transport_options(self):
         """Test that transport protocol options are documented."""
-        result = self.run_command(["--help"])
+        result = self.run_help()
         self.assert_exit_code(result, 0)
         # Should mention transport protocols
         assert "stdio" in result.stdout.lower(), "stdio transport not mentioned in help"
@@ -219,32 +285,36 @@ class StandaloneTestRunner:
         # Should have error message, not a Python traceback
         assert "Error" in result.stderr or "error" in result.stderr or "no such option" in result.stderr.lower()
 
-    def run_all_tests(self):
+    def run_all_tests(self, jobs: int = 4):
         """Run all standalone tests."""
         print("=" * 60)
         print("STANDALONE EXECUTABLE TEST SUITE")
         print(f"Executable: {self.executable}")
         print("=" * 60)
 
-        # Basic functionality
+        # The first run may need to unpack the executable, so it runs on its own
         self.test("Executable starts without errors", self.test_executable_starts)
-        self.test("--help command works", self.test_help_command)
-        self.test("Version information available", self.test_version_info)
 
-        # Path handling
-        self.test("Frozen mode detection", self.test_frozen_mode_detection)
-        self.test("No Python path errors", self.test_no_python_path_errors)
-
-        # Configuration
-        self.test("SERENA_STANDALONE env var", self.test_standalone_mode_env_var)
-        self.test("Config file operations", self.test_config_file_env)
-
-        # CLI options
-        self.test("CLI options present", self.test_cli_options_present)
-        self.test("Transport options documented", self.test_transport_options)
-
-        # Error handling
-        self.test("Invalid option fails gracefully", self.test_invalid_option_fails_gracefully)
+        # The remaining tests are independent of each other
+        self.test_concurrently(
+            [
+                # Basic functionality
+                ("--help command works", self.test_help_command),
+                ("Version information available", self.test_version_info),
+                # Path handling
+                ("Frozen mode detection", self.test_frozen_mode_detection),
+                ("No Python path errors", self.test_no_python_path_errors),
+                # Configuration
+                ("SERENA_STANDALONE env var", self.test_standalone_mode_env_var),
+                ("Config file operations", self.test_config_file_env),
+                # CLI options
+                ("CLI options present", self.test_cli_options_present),
+                ("Transport options documented", self.test_transport_options),
+                # Error handling
+                ("Invalid option fails gracefully", self.test_invalid_option_fails_gracefully),
+            ],
+            jobs,
+        )
 
         # Summary
         print("\n" + "=" * 60)
@@ -262,6 +332,12 @@ class StandaloneTestRunner:
 def main():
     parser = argparse.ArgumentParser(description="Test standalone Serena executable")
     parser.add_argument("executable", help="Path to the standalone executable")
+    parser.add_argument(
+        "--jobs",
+        help="Number of tests to run concurrently (default: 4)",
+        type=int,
+        default=4,
+    )
     parser.add_argument(
         "--json-output",
         help="Path to write JSON test results",
@@ -272,7 +348,7 @@ def main():
 
     try:
         runner = StandaloneTestRunner(args.executable)
-        success = runner.run_all_tests()
+        success = runner.run_all_tests(jobs=args.jobs)
 
         if args.json_output:
             with open(args.json_output, "w") as f:
@@ -282,7 +358,7 @@ def main():
                         "total": runner.tests_passed + runner.tests_failed,
                         "passed": runner.tests_passed,
                         "failed": runner.tests_failed,
-                        "results": runner.test_results,
+                        "results": [test_result.to_dict() for test_result in runner.test_results],
                     },
                     f,
                     indent=2,
@@ -18,6 +18,6 @@ def serena_version() -> str:
             version += f"-{git_status.commit[:8]}"
             if not git_status.is_clean:
                 version += "-dirty"
-    except:
+    except Exception:
         pass
     return version
@@ -2,6 +2,7 @@
 The Serena Model Context Protocol (MCP) Server
 """
 
+import json
 import sys
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Iterator, Sequence
@@ -124,8 +125,6 @@ class SerenaMCPFactory:
                         simplified.append(sub)
                     # If all subs are the same after integer→number, collapse
                     try:
-                        import json
-
                         canon = [json.dumps(x, sort_keys=True) for x in simplified]
                         if len(set(canon)) == 1:
                             # copy the single schema up
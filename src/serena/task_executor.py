@@ -102,7 +102,7 @@ class TaskExecutor:
             """
             try:
                 self.future.result(timeout=timeout)
-            except:
+            except Exception:
                 pass
 
     def _process_task_queue(self) -> None:
@@ -47,11 +47,8 @@ TAPLO_SHA256_CHECKSUMS: dict[str, str] = {
 
 def _verify_sha256(file_path: str, expected_hash: str) -> bool:
     """Verify SHA256 checksum of a downloaded file."""
-    sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-    actual_hash = sha256_hash.hexdigest()
+        actual_hash = hashlib.file_digest(f, "sha256").hexdigest()
     return actual_hash.lower() == expected_hash.lower()
 
 
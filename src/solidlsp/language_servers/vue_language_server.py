@@ -184,15 +184,15 @@ class VueLanguageServer(SolidLanguageServer):
 
     def _find_all_vue_files(self) -> list[str]:
         vue_files = []
-        repo_path = Path(self.repository_root_path)
-
-        for vue_file in repo_path.rglob("*.vue"):
-            try:
-                relative_path = str(vue_file.relative_to(repo_path))
-                if "node_modules" not in relative_path and not relative_path.startswith("."):
-                    vue_files.append(relative_path)
-            except Exception as e:
-                log.debug(f"Error processing Vue file {vue_file}: {e}")
+        repo_root = self.repository_root_path
+
+        for root, dirs, files in os.walk(repo_root):
+            is_repo_root = root == repo_root
+            # prune excluded directories instead of filtering matches afterwards, so that node_modules is never traversed
+            dirs[:] = [d for d in dirs if "node_modules" not in d and not (is_repo_root and d.startswith("."))]
+            for file in files:
+                if file.endswith(".vue") and "node_modules" not in file and not (is_repo_root and file.startswith(".")):
+                    vue_files.append(os.path.relpath(os.path.join(root, file), repo_root))
 
         return vue_files
 
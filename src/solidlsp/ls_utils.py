@@ -8,9 +8,11 @@ import os
 import platform
 import shutil
 import subprocess
+import threading
 import uuid
 import zipfile
 from enum import Enum
+from functools import cache
 from pathlib import Path, PurePath
 
 import charset_normalizer
@@ -18,6 +20,7 @@ import requests
 
 from solidlsp.ls_exceptions import SolidLSPException
 from solidlsp.ls_types import UnifiedSymbolInformation
+from solidlsp.util.zip import COPY_BUFFER_SIZE
 
 log = logging.getLogger(__name__)
 
@@ -171,6 +174,24 @@ class FileUtils:
     Utility functions for file operations.
     """
 
+    _http_sessions = threading.local()
+
+    @classmethod
+    def _get_http_session(cls) -> requests.Session:
+        """
+        Returns the HTTP session of the calling thread, so that consecutive downloads reuse pooled connections
+        (and TLS handshakes) to the same host, e.g. several GitHub release assets.
+
+        The session is never closed explicitly; it lives as long as its thread and is released together with the thread's
+        local data when the thread exits (for the main thread, at interpreter shutdown). Downloads only happen during
+        language server setup, so this amounts to at most one idle connection pool per downloading thread.
+        """
+        session = getattr(cls._http_sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            cls._http_sessions.session = session
+        return session
+
     @staticmethod
     def read_file(file_path: str, encoding: str) -> str:
         """
@@ -179,9 +200,6 @@ class FileUtils:
 
         Raises FileNotFoundError if the file does not exist.
         """
-        if not os.path.exists(file_path):
-            log.error(f"Failed to read '{file_path}': File does not exist.")
-            raise FileNotFoundError(f"File read '{file_path}' failed: File does not exist.")
         try:
             try:
                 with open(file_path, encoding=encoding) as inp_file:
@@ -195,6 +213,10 @@ class FileUtils:
                     )
                     return match.raw.decode(match.encoding)
                 raise ude
+        except FileNotFoundError:
+            # EAFP: letting open() fail saves a separate existence check on every read
+            log.error(f"Failed to read '{file_path}': File does not exist.")
+            raise FileNotFoundError(f"File read '{file_path}' failed: File does not exist.") from None
         except Exception as exc:
             log.error(f"Failed to read '{file_path}' with encoding '{encoding}': {exc}")
             raise exc
@@ -206,12 +228,12 @@ class FileUtils:
         """
         os.makedirs(os.path.dirname(target_path), exist_ok=True)
         try:
-            response = requests.get(url, stream=True, timeout=60)
-            if response.status_code != 200:
-                log.error(f"Error downloading file '{url}': {response.status_code} {response.text}")
-                raise SolidLSPException("Error downloading file.")
-            with open(target_path, "wb") as f:
-                shutil.copyfileobj(response.raw, f)
+            with FileUtils._get_http_session().get(url, stream=True, timeout=60) as response:
+                if response.status_code != 200:
+                    log.error(f"Error downloading file '{url}': {response.status_code} {response.text}")
+                    raise SolidLSPException("Error downloading file.")
+                with open(target_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, COPY_BUFFER_SIZE)
         except Exception as exc:
             log.error(f"Error downloading file '{url}': {exc}")
             raise SolidLSPException("Error downloading file.") from None
@@ -248,11 +270,11 @@ class FileUtils:
                 tmp_file_name_ungzipped = tmp_file_name + ".zip"
                 tmp_files.append(tmp_file_name_ungzipped)
                 with gzip.open(tmp_file_name, "rb") as f_in, open(tmp_file_name_ungzipped, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                    shutil.copyfileobj(f_in, f_out, COPY_BUFFER_SIZE)
                 shutil.unpack_archive(tmp_file_name_ungzipped, target_path, "zip")
             elif archive_type == "gz":
                 with gzip.open(tmp_file_name, "rb") as f_in, open(target_path, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                    shutil.copyfileobj(f_in, f_out, COPY_BUFFER_SIZE)
             elif archive_type == "binary":
                 # For single binary files, just move to target without extraction
                 shutil.move(tmp_file_name, target_path)
@@ -264,8 +286,7 @@ class FileUtils:
             raise SolidLSPException("Error extracting archive.") from exc
         finally:
             for tmp_file_name in tmp_files:
-                if os.path.exists(tmp_file_name):
-                    Path.unlink(Path(tmp_file_name))
+                Path(tmp_file_name).unlink(missing_ok=True)
 
 
 class PlatformId(str, Enum):
@@ -300,9 +321,14 @@ class PlatformUtils:
     """
 
     @classmethod
+    @cache
     def get_platform_id(cls) -> PlatformId:
         """
-        Returns the platform id for the current system
+        Returns the platform id for the current system.
+
+        The result is cached, since the platform cannot change while the process is running and the detection
+        is expensive (platform.architecture() runs the external `file` command, platform.libc_ver() scans the
+        Python executable).
         """
         system = platform.system()
         machine = platform.machine()
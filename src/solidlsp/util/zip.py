@@ -1,6 +1,7 @@
 import fnmatch
 import logging
 import os
+import shutil
 import sys
 import zipfile
 from pathlib import Path
@@ -8,6 +9,9 @@ from typing import Optional
 
 log = logging.getLogger(__name__)
 
+COPY_BUFFER_SIZE = 1024 * 1024
+"""Chunk size for streaming downloads and archive members to disk (shutil's default is 64 KiB on Linux/macOS)"""
+
 
 class SafeZipExtractor:
     """
@@ -95,9 +99,9 @@ class SafeZipExtractor:
             # Handle long paths on Windows
             final_path = self._normalize_path(target_path)
 
-            # Extract file
+            # Extract file, streaming it in chunks rather than reading the whole member into memory
             with zip_ref.open(member) as source, open(final_path, "wb") as target:
-                target.write(source.read())
+                shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
 
             if self.verbose:
                 log.info(f"Extracted: {member.filename}")
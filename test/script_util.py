@@ -0,0 +1,20 @@
+"""Helpers for testing the standalone scripts in scripts/."""
+
+import functools
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+
+@functools.cache
+def load_script(script_path: Path) -> ModuleType:
+    """Load a script as a module once and share it across tests."""
+    spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -5,14 +5,19 @@ Tests for bundled language server functionality (offline/standalone mode).
 from __future__ import annotations
 
 import tempfile
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
 from solidlsp.language_servers.common import (
     check_bundled_ls,
     copy_bundled_ls_to_cache,
     should_download_ls,
 )
 from solidlsp.settings import SolidLSPSettings
+from test.script_util import SCRIPTS_DIR, load_script
 
 
 class TestCheckBundledLS:
@@ -211,3 +216,45 @@ class TestBundleLSScript:
             output_dir = Path(tmpdir)
             subdirs = list(output_dir.iterdir())
             assert len(subdirs) == 0, f"Dry-run created files: {subdirs}"
+
+    def test_concurrent_downloads_keep_submission_order(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify downloads run concurrently, results keep submission order and optional failures don't fail the run."""
+        bundler = load_script(SCRIPTS_DIR / "bundle_language_servers.py")
+        requested = ["clangd", "dart", "lua-ls", "gopls"]  # gopls is optional
+        all_started = threading.Barrier(len(requested), timeout=10)
+
+        def fake_download(ls_bundle, platform_id, output_dir, dry_run=False) -> bool:
+            # Only passes if all downloads run at the same time; they then finish in reverse order
+            all_started.wait()
+            time.sleep(0.05 * (len(requested) - requested.index(ls_bundle.id)))
+            return ls_bundle.id != "gopls"
+
+        manifests: list[list[str]] = []
+        monkeypatch.setattr(bundler, "download_language_server", fake_download)
+        monkeypatch.setattr(bundler, "create_manifest", lambda output_dir, platform_id, downloaded: manifests.append(downloaded))
+
+        returncode = bundler.main(
+            ["--output-dir", str(tmp_path), "--platform", "linux-x64", "--jobs", str(len(requested)), "--ls", *requested]
+        )
+
+        assert returncode == 0
+        assert manifests == [["clangd", "dart", "lua-ls"]]
+
+    def test_jobs_is_clamped_to_one(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify --jobs 0 still downloads with a single worker."""
+        bundler = load_script(SCRIPTS_DIR / "bundle_language_servers.py")
+        thread_pool_executor = bundler.ThreadPoolExecutor
+        worker_counts: list[int | None] = []
+
+        def recording_executor(max_workers: int | None = None):
+            worker_counts.append(max_workers)
+            return thread_pool_executor(max_workers=max_workers)
+
+        monkeypatch.setattr(bundler, "ThreadPoolExecutor", recording_executor)
+        monkeypatch.setattr(bundler, "download_language_server", lambda ls_bundle, platform_id, output_dir, dry_run=False: True)
+        monkeypatch.setattr(bundler, "create_manifest", lambda output_dir, platform_id, downloaded: None)
+
+        returncode = bundler.main(["--output-dir", str(tmp_path), "--platform", "linux-x64", "--jobs", "0", "--ls", "clangd"])
+
+        assert returncode == 0
+        assert worker_counts == [1]
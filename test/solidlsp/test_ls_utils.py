@@ -0,0 +1,86 @@
+"""
+Tests for the download helpers in solidlsp.ls_utils.
+"""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from solidlsp.ls_exceptions import SolidLSPException
+from solidlsp.ls_utils import FileUtils
+
+_FILES = {
+    "/small.txt": b"hello world",
+    "/large.bin": bytes(range(256)) * 10_000,
+}
+
+
+class _FileRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so that the session can reuse its connection
+
+    def do_GET(self) -> None:
+        body = _FILES.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url() -> Iterator[str]:
+    """Serve _FILES from a local HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FileRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+class TestDownloadFile:
+    """Tests for FileUtils.download_file."""
+
+    def test_consecutive_downloads_share_session(self, server_url: str, tmp_path: Path) -> None:
+        """Several downloads on one thread should all succeed using the same session."""
+        session = FileUtils._get_http_session()
+        for _ in range(2):
+            for path, body in _FILES.items():
+                target = tmp_path / "downloads" / path.lstrip("/")
+                FileUtils.download_file(server_url + path, str(target))
+                assert target.read_bytes() == body
+        assert FileUtils._get_http_session() is session
+
+    def test_threads_get_own_session(self) -> None:
+        """Each thread should use its own session, since requests.Session is not thread-safe."""
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(FileUtils._get_http_session()))
+        thread.start()
+        thread.join()
+        assert sessions[0] is not FileUtils._get_http_session()
+
+    def test_error_status_raises(self, server_url: str, tmp_path: Path) -> None:
+        """A non-200 response should raise SolidLSPException and not leave a file behind."""
+        target = tmp_path / "missing.txt"
+        with pytest.raises(SolidLSPException):
+            FileUtils.download_file(server_url + "/missing.txt", str(target))
+        assert not target.exists()
+
+    def test_session_usable_after_error(self, server_url: str, tmp_path: Path) -> None:
+        """A failed download should not break subsequent downloads on the same thread."""
+        with pytest.raises(SolidLSPException):
+            FileUtils.download_file(server_url + "/missing.txt", str(tmp_path / "missing.txt"))
+        target = tmp_path / "small.txt"
+        FileUtils.download_file(server_url + "/small.txt", str(target))
+        assert target.read_bytes() == _FILES["/small.txt"]
@@ -1,17 +1,20 @@
 """Tests for scripts/build_custom_serena.py"""
 
+import io
 import json
-import subprocess
-import sys
+import logging
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 import pytest
 
+from test.script_util import SCRIPTS_DIR, load_script
+
 
 @pytest.fixture
 def script_path() -> Path:
     """Path to build_custom_serena.py script."""
-    return Path(__file__).parent.parent / "scripts" / "build_custom_serena.py"
+    return SCRIPTS_DIR / "build_custom_serena.py"
 
 
 @pytest.fixture
@@ -21,15 +24,20 @@ def temp_config(tmp_path: Path) -> Path:
 
 
 def run_script(script_path: Path, args: list[str]) -> tuple[int, str, str]:
-    """Run the script with given arguments.
+    """Run the script's main() in-process with given arguments.
 
     Returns:
         Tuple of (returncode, stdout, stderr)
 
     """
-    cmd = [sys.executable, str(script_path)] + args
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    return result.returncode, result.stdout, result.stderr
+    module = load_script(script_path)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            returncode = module.main(args)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+    return returncode, stdout.getvalue(), stderr.getvalue()
 
 
 def test_script_exists(script_path: Path) -> None:
@@ -203,6 +211,15 @@ def test_load_config(script_path: Path, temp_config: Path) -> None:
     assert "[DRY RUN]" in stdout or "dry" in stdout.lower() or "Selection Summary" in stdout
 
 
+def test_load_missing_config(script_path: Path, tmp_path: Path) -> None:
+    """Test that a missing config file is reported instead of raising."""
+    returncode, stdout, stderr = run_script(script_path, ["--config", str(tmp_path / "missing.json"), "--dry-run"])
+
+    assert returncode == 1
+    assert "Config file not found" in stdout
+    assert "Traceback" not in stderr
+
+
 def test_platform_override(script_path: Path, temp_config: Path) -> None:
     """Test platform override functionality."""
     returncode, stdout, stderr = run_script(
@@ -262,6 +279,34 @@ def test_no_pyinstaller_flag(script_path: Path, temp_config: Path) -> None:
     assert config.get("skip_pyinstaller") is True or config.get("run_pyinstaller") is False
 
 
+def test_in_process_bundling_failure(script_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an exception in the in-process bundler makes the build fail instead of escaping run_build."""
+    module = load_script(script_path)
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory")
+    config = module.BuildConfig(
+        languages=["clangd"],
+        platform="linux-x64",
+        output_dir=str(blocker / "language_servers"),
+        skip_pyinstaller=True,
+        resolved_languages=["clangd"],
+    )
+
+    # Without root handlers, the bundler's logging.basicConfig() call installs its own StreamHandler
+    root_logger = logging.getLogger()
+    monkeypatch.setattr(root_logger, "handlers", [])
+    monkeypatch.setattr(root_logger, "level", logging.WARNING)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        returncode = module.run_build(config)
+
+    assert returncode != 0
+    assert "Bundling failed" in stdout.getvalue()
+    # The bundler's logging setup must not leak into the calling process
+    assert root_logger.handlers == []
+    assert root_logger.level == logging.WARNING
+
+
 def test_config_json_format(script_path: Path, temp_config: Path) -> None:
     """Test that saved config is valid JSON with expected structure."""
     returncode, stdout, stderr = run_script(script_path, ["--preset", "standard", "--save-config", str(temp_config), "--dry-run"])
@@ -13,7 +13,6 @@ Usage:
 
 import os
 import sys
-import tempfile
 from pathlib import Path
 from unittest import mock
 
@@ -30,87 +29,75 @@ from solidlsp.settings import SolidLSPSettings
 # FIXTURES
 # =============================================================================
 
+# Fake executables in the bundled language server tree, by package directory
+_BUNDLED_NPM_EXECUTABLES = {
+    "ts-lsp": "typescript-language-server",
+    "yaml-lsp": "yaml-language-server",
+    "bash-lsp": "bash-language-server",
+    "php-lsp": "intelephense",
+    "vts-lsp": "vtsls",
+}
 
-@pytest.fixture
-def temp_bundled_dir():
-    """Create a temporary directory structure simulating bundled language servers."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create bundled language server structure
-        ls_dir = Path(tmpdir) / "language_servers"
-        ls_dir.mkdir()
-
-        # Create ts-lsp with fake executable
-        ts_lsp = ls_dir / "ts-lsp" / "node_modules" / ".bin"
-        ts_lsp.mkdir(parents=True)
-        ts_exec = ts_lsp / "typescript-language-server"
-        ts_exec.touch()
-        ts_exec.chmod(0o755)
-
-        # Create yaml-lsp with fake executable
-        yaml_lsp = ls_dir / "yaml-lsp" / "node_modules" / ".bin"
-        yaml_lsp.mkdir(parents=True)
-        yaml_exec = yaml_lsp / "yaml-language-server"
-        yaml_exec.touch()
-        yaml_exec.chmod(0o755)
-
-        # Create bash-lsp with fake executable
-        bash_lsp = ls_dir / "bash-lsp" / "node_modules" / ".bin"
-        bash_lsp.mkdir(parents=True)
-        bash_exec = bash_lsp / "bash-language-server"
-        bash_exec.touch()
-        bash_exec.chmod(0o755)
-
-        # Create php-lsp with fake executable
-        php_lsp = ls_dir / "php-lsp" / "node_modules" / ".bin"
-        php_lsp.mkdir(parents=True)
-        php_exec = php_lsp / "intelephense"
-        php_exec.touch()
-        php_exec.chmod(0o755)
-
-        # Create vts-lsp with fake executable
-        vts_lsp = ls_dir / "vts-lsp" / "node_modules" / ".bin"
-        vts_lsp.mkdir(parents=True)
-        vts_exec = vts_lsp / "vtsls"
-        vts_exec.touch()
-        vts_exec.chmod(0o755)
-
-        yield tmpdir
+_NODE_NAME = "node.exe" if sys.platform == "win32" else "node"
+_NPM_NAME = "npm.cmd" if sys.platform == "win32" else "npm"
 
 
-@pytest.fixture
-def temp_node_dir():
-    """Create a temporary directory with fake Node.js binary."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        node_dir = Path(tmpdir) / "node"
-        node_dir.mkdir()
+@pytest.fixture(scope="session")
+def temp_bundled_dir(tmp_path_factory) -> str:
+    """
+    Create a temporary directory structure simulating bundled language servers.
+
+    The tree is only ever read by the tests, so it is built once per session.
+    """
+    tmpdir = tmp_path_factory.mktemp("bundled")
+
+    # Create bundled language server structure with a fake executable for each npm-based language server
+    ls_dir = tmpdir / "language_servers"
+    for package_dir_name, binary_name in _BUNDLED_NPM_EXECUTABLES.items():
+        bin_dir = ls_dir / package_dir_name / "node_modules" / ".bin"
+        os.makedirs(bin_dir)
+        executable = bin_dir / binary_name
+        executable.touch()
+        executable.chmod(0o755)
+
+    return str(tmpdir)
 
-        # Create fake node binary
-        node_name = "node.exe" if sys.platform == "win32" else "node"
-        node_exec = node_dir / node_name
-        node_exec.touch()
-        node_exec.chmod(0o755)
 
-        # Create fake npm binary
-        npm_name = "npm.cmd" if sys.platform == "win32" else "npm"
-        npm_exec = node_dir / npm_name
-        npm_exec.touch()
-        npm_exec.chmod(0o755)
+@pytest.fixture(scope="session")
+def temp_node_dir(tmp_path_factory) -> str:
+    """Create a temporary directory with fake Node.js binary (read-only for the tests, built once per session)."""
+    tmpdir = tmp_path_factory.mktemp("node")
+    node_dir = tmpdir / "node"
+    node_dir.mkdir()
 
-        yield tmpdir
+    # Create fake node binary
+    node_exec = node_dir / _NODE_NAME
+    node_exec.touch()
+    node_exec.chmod(0o755)
+
+    # Create fake npm binary
+    npm_exec = node_dir / _NPM_NAME
+    npm_exec.touch()
+    npm_exec.chmod(0o755)
+
+    return str(tmpdir)
+
+
+@pytest.fixture(scope="session")
+def bundled_node_path(temp_node_dir) -> str:
+    """Path of the fake bundled Node.js binary."""
+    return str(Path(temp_node_dir) / "node" / _NODE_NAME)
 
 
 @pytest.fixture
-def bundled_settings(temp_bundled_dir, temp_node_dir):
+def bundled_settings(temp_bundled_dir, bundled_node_path):
     """Create SolidLSPSettings with bundled resources."""
     ls_dir = str(Path(temp_bundled_dir) / "language_servers")
-    node_dir = Path(temp_node_dir) / "node"
-    node_name = "node.exe" if sys.platform == "win32" else "node"
-    node_path = str(node_dir / node_name)
 
     settings = SolidLSPSettings(
         standalone_mode=True,
         bundled_ls_dir=ls_dir,
-        bundled_node_path=node_path,
+        bundled_node_path=bundled_node_path,
         allow_download_fallback=False,
     )
     return settings
@@ -137,57 +124,17 @@ def non_bundled_settings():
 class TestBundledPathResolution:
     """Tests for bundled npm package path resolution."""
 
-    def test_get_bundled_npm_package_path_typescript(self, bundled_settings):
-        """Test finding bundled TypeScript language server."""
-        path = get_bundled_npm_package_path(
-            bundled_settings,
-            package_dir_name="ts-lsp",
-            binary_name="typescript-language-server",
-        )
-        assert path is not None
-        assert "ts-lsp" in path
-        assert "typescript-language-server" in path
-
-    def test_get_bundled_npm_package_path_yaml(self, bundled_settings):
-        """Test finding bundled YAML language server."""
-        path = get_bundled_npm_package_path(
-            bundled_settings,
-            package_dir_name="yaml-lsp",
-            binary_name="yaml-language-server",
-        )
-        assert path is not None
-        assert "yaml-lsp" in path
-        assert "yaml-language-server" in path
-
-    def test_get_bundled_npm_package_path_bash(self, bundled_settings):
-        """Test finding bundled Bash language server."""
-        path = get_bundled_npm_package_path(
-            bundled_settings,
-            package_dir_name="bash-lsp",
-            binary_name="bash-language-server",
-        )
-        assert path is not None
-        assert "bash-lsp" in path
-
-    def test_get_bundled_npm_package_path_php(self, bundled_settings):
-        """Test finding bundled PHP language server (Intelephense)."""
+    @pytest.mark.parametrize(("package_dir_name", "binary_name"), list(_BUNDLED_NPM_EXECUTABLES.items()))
+    def test_get_bundled_npm_package_path(self, bundled_settings, package_dir_name, binary_name):
+        """Test finding each bundled npm-based language server."""
         path = get_bundled_npm_package_path(
             bundled_settings,
-            package_dir_name="php-lsp",
-            binary_name="intelephense",
+            package_dir_name=package_dir_name,
+            binary_name=binary_name,
         )
         assert path is not None
-        assert "php-lsp" in path
-
-    def test_get_bundled_npm_package_path_vts(self, bundled_settings):
-        """Test finding bundled VTS language server."""
-        path = get_bundled_npm_package_path(
-            bundled_settings,
-            package_dir_name="vts-lsp",
-            binary_name="vtsls",
-        )
-        assert path is not None
-        assert "vts-lsp" in path
+        assert package_dir_name in path
+        assert binary_name in path
 
     def test_get_bundled_npm_package_path_not_found(self, bundled_settings):
         """Test returns None for non-existent package."""
@@ -258,55 +205,31 @@ class TestNodePathResolution:
 class TestSettingsInitialization:
     """Tests for SolidLSPSettings initialization."""
 
-    def test_standalone_mode_from_env_true(self):
-        """Test standalone mode detection from environment variable."""
-        with mock.patch.dict(os.environ, {"SERENA_STANDALONE": "true"}):
-            # Need to re-evaluate the default factory
-            from solidlsp.settings import _is_standalone_mode
-
-            assert _is_standalone_mode() is True
-
-    def test_standalone_mode_from_env_1(self):
-        """Test standalone mode detection from environment variable (1)."""
-        with mock.patch.dict(os.environ, {"SERENA_STANDALONE": "1"}):
-            from solidlsp.settings import _is_standalone_mode
-
-            assert _is_standalone_mode() is True
+    @pytest.mark.parametrize(("value", "expected"), [("true", True), ("1", True), ("yes", True), ("", False)])
+    def test_standalone_mode_from_env(self, monkeypatch, value, expected):
+        """Test standalone mode detection from the SERENA_STANDALONE environment variable."""
+        monkeypatch.setenv("SERENA_STANDALONE", value)
+        # Need to re-evaluate the default factory
+        from solidlsp.settings import _is_standalone_mode
 
-    def test_standalone_mode_from_env_yes(self):
-        """Test standalone mode detection from environment variable (yes)."""
-        with mock.patch.dict(os.environ, {"SERENA_STANDALONE": "yes"}):
-            from solidlsp.settings import _is_standalone_mode
+        assert _is_standalone_mode() is expected
 
-            assert _is_standalone_mode() is True
-
-    def test_standalone_mode_from_env_false(self):
-        """Test standalone mode is false when env var is not set."""
-        with mock.patch.dict(os.environ, {"SERENA_STANDALONE": ""}):
-            from solidlsp.settings import _is_standalone_mode
-
-            assert _is_standalone_mode() is False
-
-    def test_bundled_ls_dir_from_env(self):
+    def test_bundled_ls_dir_from_env(self, monkeypatch, temp_bundled_dir):
         """Test bundled LS dir detection from environment variable."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with mock.patch.dict(os.environ, {"SERENA_BUNDLED_LS_DIR": tmpdir}):
-                from solidlsp.settings import _get_bundled_ls_dir
+        # Any existing directory will do, so reuse the session's bundled tree rather than creating one
+        monkeypatch.setenv("SERENA_BUNDLED_LS_DIR", temp_bundled_dir)
+        from solidlsp.settings import _get_bundled_ls_dir
 
-                result = _get_bundled_ls_dir()
-                assert result == tmpdir
+        result = _get_bundled_ls_dir()
+        assert result == temp_bundled_dir
 
-    def test_bundled_node_from_env(self, temp_node_dir):
+    def test_bundled_node_from_env(self, monkeypatch, bundled_node_path):
         """Test bundled Node.js detection from environment variable."""
-        node_dir = Path(temp_node_dir) / "node"
-        node_name = "node.exe" if sys.platform == "win32" else "node"
-        node_path = str(node_dir / node_name)
-
-        with mock.patch.dict(os.environ, {"SERENA_BUNDLED_NODE": node_path}):
-            from solidlsp.settings import _get_bundled_node_path
+        monkeypatch.setenv("SERENA_BUNDLED_NODE", bundled_node_path)
+        from solidlsp.settings import _get_bundled_node_path
 
-            result = _get_bundled_node_path()
-            assert result == node_path
+        result = _get_bundled_node_path()
+        assert result == bundled_node_path
 
 
 # =============================================================================
@@ -69,42 +69,55 @@ def standalone_exe(request) -> Path:
     return exe
 
 
+def run_executable(exe: Path, args: list[str], timeout: int = 30, env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
+    """Run the standalone executable with the given arguments."""
+    cmd = [str(exe)] + args
+    full_env = os.environ.copy()
+    if env:
+        full_env.update(env)
+
+    return subprocess.run(
+        cmd,
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env=full_env,
+    )
+
+
 @pytest.fixture
 def run_exe(standalone_exe: Path):
     """Fixture providing a function to run the standalone executable."""
 
     def _run(args: list[str], timeout: int = 30, env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
-        cmd = [str(standalone_exe)] + args
-        full_env = os.environ.copy()
-        if env:
-            full_env.update(env)
-
-        return subprocess.run(
-            cmd,
-            check=False,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=full_env,
-        )
+        return run_executable(standalone_exe, args, timeout=timeout, env=env)
 
     return _run
 
 
+@pytest.fixture(scope="module")
+def help_result(standalone_exe: Path) -> subprocess.CompletedProcess:
+    """
+    Result of running the executable with --help, shared by all tests that only inspect the help output,
+    so that the (slow) start-up of the frozen executable is paid once.
+    """
+    return run_executable(standalone_exe, ["--help"])
+
+
 # =============================================================================
 # BASIC FUNCTIONALITY TESTS
 # =============================================================================
 
 
 @pytest.mark.standalone
-def test_help_command(run_exe):
+def test_help_command(help_result):
     """Test --help shows usage information."""
-    result = run_exe(["--help"])
-    assert result.returncode == 0
-    assert "serena mcp server" in result.stdout.lower()
-    assert "--project" in result.stdout
-    assert "--context" in result.stdout
-    assert "--mode" in result.stdout
+    assert help_result.returncode == 0
+    assert "serena mcp server" in help_result.stdout.lower()
+    assert "--project" in help_result.stdout
+    assert "--context" in help_result.stdout
+    assert "--mode" in help_result.stdout
 
 
 @pytest.mark.standalone
@@ -117,11 +130,10 @@ def test_executable_starts_without_import_errors(run_exe):
 
 
 @pytest.mark.standalone
-def test_no_python_path_errors(run_exe):
+def test_no_python_path_errors(help_result):
     """Test that frozen path handling works (no _MEIPASS errors)."""
-    result = run_exe(["--help"])
-    assert result.returncode == 0
-    assert "_MEIPASS" not in result.stderr
+    assert help_result.returncode == 0
+    assert "_MEIPASS" not in help_result.stderr
     # No PyInstaller-specific errors visible to user
     error_indicators = [
         "ModuleNotFoundError",
@@ -131,7 +143,7 @@ def test_no_python_path_errors(run_exe):
         "cannot import name",
     ]
     for indicator in error_indicators:
-        assert indicator not in result.stderr, f"Found '{indicator}' in stderr"
+        assert indicator not in help_result.stderr, f"Found '{indicator}' in stderr"
 
 
 # =============================================================================
@@ -140,12 +152,11 @@ def test_no_python_path_errors(run_exe):
 
 
 @pytest.mark.standalone
-def test_frozen_mode_detection(run_exe):
+def test_frozen_mode_detection(help_result):
     """Test that frozen mode is detected correctly."""
-    result = run_exe(["--help"])
-    assert result.returncode == 0
+    assert help_result.returncode == 0
     # No errors about PyInstaller internals
-    assert "_MEIPASS" not in result.stderr
+    assert "_MEIPASS" not in help_result.stderr
 
 
 # =============================================================================
@@ -185,10 +196,9 @@ def test_home_directory_override(run_exe):
 
 
 @pytest.mark.standalone
-def test_cli_options_present(run_exe):
+def test_cli_options_present(help_result):
     """Test all expected CLI options are present."""
-    result = run_exe(["--help"])
-    assert result.returncode == 0
+    assert help_result.returncode == 0
 
     expected_options = [
         "--project",
@@ -201,15 +211,14 @@ def test_cli_options_present(run_exe):
     ]
 
     for option in expected_options:
-        assert option in result.stdout, f"Option '{option}' not found in help"
+        assert option in help_result.stdout, f"Option '{option}' not found in help"
 
 
 @pytest.mark.standalone
-def test_transport_options_documented(run_exe):
+def test_transport_options_documented(help_result):
     """Test that transport protocol options are documented."""
-    result = run_exe(["--help"])
-    assert result.returncode == 0
-    assert "stdio" in result.stdout.lower()
+    assert help_result.returncode == 0
+    assert "stdio" in help_result.stdout.lower()
 
 
 # =============================================================================